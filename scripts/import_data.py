@@ -8,17 +8,31 @@ Author: [Your Name]
 Date: December 2025
 """
 
-import pandas as pd
-import psycopg2
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-import sys
-import os
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Set
+
+import asyncpg
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
 from dotenv import load_dotenv
+from pyarrow import csv as pa_csv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 CONFIG = {
     'csv_file': os.getenv('CSV_FILE_PATH', r'C:\supply-chain-sql-powerbi\data\DataCoSupplyChainDataset.csv'),
     'db_config': {
@@ -28,335 +42,624 @@ CONFIG = {
         'user': os.getenv('DB_USER', 'postgres'),
         'password': os.getenv('DB_PASSWORD', '')
     },
-    'batch_size': int(os.getenv('BATCH_SIZE', 1000))
+    # 'copy' streams rows with binary COPY; 'insert' falls back to batched INSERTs
+    'load_method': os.getenv('LOAD_METHOD', 'copy'),
+    # Parallel staging is opt-in: every row is still moved serially on the main connection
+    'workers': int(os.getenv('IMPORT_WORKERS', 1)),
+    'chunk_size': int(os.getenv('CHUNK_SIZE', 50_000))
 }
 
 
 class SupplyChainImporter:
     """Handles ETL pipeline from CSV to PostgreSQL database."""
     
+    # Below this many rows per worker, process startup costs more than it saves
+    MIN_ROWS_PER_WORKER = 10_000
+    
+    # Workers read base tables the main connection holds locks on until it commits. If
+    # another session queues an exclusive lock in between, nothing can move and Postgres
+    # cannot see the deadlock, so workers give up instead and the import fails cleanly
+    WORKER_LOCK_TIMEOUT = '30s'
+    
+    # Minimum seconds between progress messages
+    PROGRESS_INTERVAL = 1.0
+    
+    # Largest magnitudes PostgreSQL INTEGER and REAL columns accept
+    INTEGER_MAX = 2**31 - 1
+    REAL_MAX = float(np.finfo(np.float32).max)
+    
+    # Source columns and their Arrow types; all other CSV columns are skipped.
+    # Numeric fields are read as text and coerced per column, so a malformed cell
+    # becomes NULL instead of aborting the file partway through.
+    # Low-cardinality text is dictionary-encoded while parsing and lands as pandas category.
+    SOURCE_COLUMNS = {
+        'Customer Id': pa.string(),
+        'Customer Email': pa.string(),
+        'Customer Fname': pa.string(),
+        'Customer Lname': pa.string(),
+        'Customer Segment': pa.dictionary(pa.int32(), pa.string()),
+        'Customer City': pa.string(),
+        'Customer State': pa.string(),
+        'Customer Country': pa.string(),
+        'Customer Zipcode': pa.string(),
+        'Customer Street': pa.string(),
+        'Latitude': pa.string(),
+        'Longitude': pa.string(),
+        'Product Name': pa.string(),
+        'Product Card Id': pa.string(),
+        'Category Name': pa.string(),
+        'Department Name': pa.string(),
+        'Product Price': pa.string(),
+        'Product Description': pa.string(),
+        'Product Image': pa.string(),
+        'Product Status': pa.string(),
+        'Order Item Id': pa.string(),
+        'order date (DateOrders)': pa.string(),
+        'Order Item Quantity': pa.string(),
+        'Sales per customer': pa.string(),
+        'Order Item Discount': pa.string(),
+        'Order Profit Per Order': pa.string(),
+        'Order Status': pa.dictionary(pa.int32(), pa.string()),
+        'Market': pa.dictionary(pa.int32(), pa.string()),
+        'Order Region': pa.dictionary(pa.int32(), pa.string()),
+        'Order Country': pa.dictionary(pa.int32(), pa.string()),
+        'Order City': pa.string(),
+        'Order State': pa.string(),
+        'Order Zipcode': pa.string(),
+        'shipping date (DateOrders)': pa.string(),
+        'Shipping Mode': pa.dictionary(pa.int32(), pa.string()),
+        'Days for shipping (real)': pa.string(),
+        'Days for shipment (scheduled)': pa.string(),
+        'Delivery Status': pa.dictionary(pa.int32(), pa.string()),
+        'Late_delivery_risk': pa.string()
+    }
+    
     def __init__(self, config: dict):
         self.config = config
-        self.conn: Optional[psycopg2.connection] = None
+        self.conn: Optional[asyncpg.Connection] = None
+        self.tx: Optional[asyncpg.transaction.Transaction] = None
+        self.reader: Optional[pa_csv.CSVStreamingReader] = None
         self.df: Optional[pd.DataFrame] = None
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.restore_ddl: List[str] = []
+        self.worker_stages: List[str] = []
+        self.stats = Counter()
+        self.rejected_products: Set[str] = set()
+    
+    @staticmethod
+    async def open_connection(db_config: dict, **settings: str) -> asyncpg.Connection:
+        """
+        Open a connection tuned for bulk loading (no WAL flush wait on commit).
+        Extra keyword arguments are passed as server settings.
+        """
+        return await asyncpg.connect(
+            **db_config, server_settings={'synchronous_commit': 'off', **settings}
+        )
         
-    def connect_database(self) -> None:
-        """Establish database connection."""
+    async def connect_database(self) -> None:
+        """Establish database connection and open the import transaction."""
         try:
-            self.conn = psycopg2.connect(**self.config['db_config'])
+            # Inline loads stage through TEMP tables; keep a whole chunk in local memory
+            self.conn = await self.open_connection(self.config['db_config'], temp_buffers='64MB')
+            await self.begin()
             print(f"✓ Connected to {self.config['db_config']['database']}")
-        except psycopg2.Error as e:
+        except (asyncpg.PostgresError, OSError) as e:
             print(f"✗ Connection failed: {e}")
             sys.exit(1)
     
+    async def begin(self) -> None:
+        """Open a new transaction; asyncpg runs in autocommit mode otherwise."""
+        self.tx = self.conn.transaction()
+        await self.tx.start()
+    
+    async def commit(self) -> None:
+        """Commit the current transaction and begin the next one."""
+        await self.tx.commit()
+        await self.begin()
+    
+    async def rollback(self) -> None:
+        """Roll back the current transaction and begin the next one."""
+        await self.tx.rollback()
+        await self.begin()
+    
     def load_csv(self) -> None:
-        """Load source CSV file."""
-        print("\n[1/5] Loading CSV...")
+        """Open the source CSV for streaming."""
+        print("\n[1/3] Opening CSV...")
         
         try:
             csv_path = Path(self.config['csv_file'])
             if not csv_path.exists():
                 raise FileNotFoundError(f"CSV not found: {csv_path}")
             
-            self.df = pd.read_csv(csv_path, encoding='latin-1', low_memory=False)
-            print(f"✓ Loaded {len(self.df):,} rows, {len(self.df.columns)} columns")
+            # Arrow parses blocks on background threads while earlier chunks are loading
+            self.reader = pa_csv.open_csv(
+                csv_path,
+                read_options=pa_csv.ReadOptions(encoding='latin-1', use_threads=True, block_size=4 << 20),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=self.SOURCE_COLUMNS,
+                    include_columns=list(self.SOURCE_COLUMNS),
+                    include_missing_columns=True,
+                    strings_can_be_null=True
+                )
+            )
+            print(f"✓ Streaming {csv_path.name} in chunks of {self.config['chunk_size']:,} rows")
             
         except Exception as e:
             print(f"✗ Failed: {e}")
             sys.exit(1)
     
+    def read_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Yield the CSV as DataFrames of about chunk_size rows.
+        Each chunk keeps a global row index so order keys stay unique across chunks.
+        """
+        batches, rows, offset = [], 0, 0
+        for batch in self.reader:
+            batches.append(batch)
+            rows += batch.num_rows
+            if rows < self.config['chunk_size']:
+                continue
+            
+            yield self.to_frame(batches, offset)
+            batches, offset, rows = [], offset + rows, 0
+        
+        if batches:
+            yield self.to_frame(batches, offset)
+    
     @staticmethod
-    def clean_numeric(value) -> Optional[float]:
-        """Convert to float, return None if invalid."""
-        try:
-            return None if pd.isna(value) else float(value)
-        except (ValueError, TypeError):
-            return None
+    def to_frame(batches: List[pa.RecordBatch], offset: int) -> pd.DataFrame:
+        """Convert record batches to pandas; dictionary columns become category, the rest ArrowDtype."""
+        frame = pa.Table.from_batches(batches).to_pandas(
+            types_mapper=lambda t: None if pa.types.is_dictionary(t) else pd.ArrowDtype(t)
+        )
+        frame.index = pd.RangeIndex(offset, offset + len(frame))
+        return frame
     
     @staticmethod
-    def clean_int(value) -> Optional[int]:
-        """Convert to integer, return None if invalid."""
-        try:
-            return None if pd.isna(value) else int(float(value))
-        except (ValueError, TypeError):
-            return None
+    def to_records(frame: pd.DataFrame) -> Iterator[tuple]:
+        """Yield DataFrame rows as plain tuples, with missing values as None."""
+        return frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None)
+    
+    @classmethod
+    async def copy_frame(cls, conn: asyncpg.Connection, table: str, frame: pd.DataFrame) -> None:
+        """Bulk load DataFrame rows with binary COPY; column names must match the table."""
+        await conn.copy_records_to_table(
+            table, records=cls.to_records(frame), columns=list(frame.columns)
+        )
     
-    def import_customers(self) -> Dict[int, int]:
+    @classmethod
+    async def insert_frame(cls, conn: asyncpg.Connection, table: str, frame: pd.DataFrame) -> None:
         """
-        Import customer records with deduplication.
-        Returns mapping of source Customer ID to database customer_id.
+        Bulk load DataFrame rows with batched INSERTs, for servers where COPY is unavailable.
+        The statement is prepared once; each row then only sends Bind/Execute.
         """
-        print("\n[2/5] Importing Customers...")
-        
-        cursor = self.conn.cursor()
-        
-        # Extract customer columns
-        customer_cols = [
-            'Customer Id', 'Customer Email', 'Customer Fname', 'Customer Lname',
-            'Customer Segment', 'Customer City', 'Customer State', 'Customer Country',
-            'Customer Zipcode', 'Customer Street', 'Latitude', 'Longitude'
+        placeholders = ', '.join(f'${i}' for i in range(1, len(frame.columns) + 1))
+        statement = await conn.prepare(
+            f"INSERT INTO {table} ({', '.join(frame.columns)}) VALUES ({placeholders})"
+        )
+        await statement.executemany(cls.to_records(frame))
+    
+    @staticmethod
+    async def execute_batch(conn: asyncpg.Connection, statements: List[str]) -> None:
+        """Run parameterless statements as one simple-query message, in a single round-trip."""
+        if statements:
+            await conn.execute(';\n'.join(statements))
+    
+    async def load_frame(self, conn: asyncpg.Connection, table: str, frame: pd.DataFrame) -> None:
+        """Bulk load DataFrame rows using the configured load method."""
+        if self.config['load_method'] == 'insert':
+            await self.insert_frame(conn, table, frame)
+        else:
+            await self.copy_frame(conn, table, frame)
+    
+    async def stage_frame(self, conn: asyncpg.Connection, kind: str, stage: str, table: str,
+                          frame: pd.DataFrame, key_type: Optional[str] = None) -> None:
+        """
+        Recreate stage as a kind ('TEMP' or 'UNLOGGED') copy of table and bulk load frame into it.
+        With key_type, the first column of frame is stored in an extra source_key column.
+        """
+        # Stage inherits the SERIAL default, so ids are drawn from the real sequence
+        statements = [
+            f"DROP TABLE IF EXISTS {stage}",
+            f"CREATE {kind} TABLE {stage} (LIKE {table} INCLUDING DEFAULTS)"
         ]
+        if key_type:
+            statements.append(f"ALTER TABLE {stage} ADD COLUMN source_key {key_type}")
+            frame = frame.rename(columns={frame.columns[0]: 'source_key'})
         
-        customers = self.df[[col for col in customer_cols if col in self.df.columns]].copy()
-        customers = customers[customers['Customer Id'].notna()]
-        
-        # Deduplicate by Customer ID
-        customers_unique = customers.groupby('Customer Id', as_index=False).first()
-        print(f"  Unique customers: {len(customers_unique):,}")
-        
-        insert_query = """
-            INSERT INTO customers (
-                customer_email, customer_fname, customer_lname, customer_segment,
-                customer_city, customer_state, customer_country, customer_zipcode,
-                customer_street, latitude, longitude
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING customer_id
+        await self.execute_batch(conn, statements)
+        await self.load_frame(conn, stage, frame)
+    
+    async def load_with_keys(self, conn: asyncpg.Connection, table: str, id_column: str,
+                             frame: pd.DataFrame, key_type: str = 'BIGINT') -> dict:
         """
+        Bulk load a DataFrame through a temporary staging table.
+        The first column of frame is the source key; remaining columns match the table.
+        Returns mapping of source key to generated database id.
+        """
+        # Later chunks rarely bring new dimension rows; skip the stage round-trips entirely
+        if frame.empty:
+            return {}
+        
+        stage = f"{table}_stage"
+        columns = ', '.join(frame.columns[1:])
+        
+        # Temp tables are never WAL-logged and are private to the session. The previous
+        # load's stage is dropped on creation rather than after it, saving a round-trip
+        await self.stage_frame(conn, 'TEMP', stage, table, frame, key_type)
+        
+        # Data-modifying CTE: rows move and the key mapping comes back in one statement
+        rows = await conn.fetch(f"""
+            WITH moved AS (
+                INSERT INTO {table} ({id_column}, {columns})
+                SELECT {id_column}, {columns} FROM {stage}
+            )
+            SELECT source_key, {id_column} FROM {stage}
+        """)
+        return dict(map(tuple, rows))
+    
+    async def load_table(self, conn: asyncpg.Connection, table: str, frame: pd.DataFrame,
+                         id_column: Optional[str] = None, key_type: str = 'BIGINT') -> dict:
+        """Load frame into table, returning the source key mapping when id_column is given."""
+        if id_column:
+            return await self.load_with_keys(conn, table, id_column, frame, key_type)
+        await self.load_frame(conn, table, frame)
+        return {}
+    
+    async def load_parallel(self, table: str, frame: pd.DataFrame, id_column: Optional[str] = None,
+                            key_type: str = 'BIGINT') -> dict:
+        """
+        Split frame into chunks staged concurrently by worker processes; small frames load inline.
+        Each worker commits its chunk to an UNLOGGED stage table, and the rows are then moved
+        into table on the main connection, so they stay inside the import transaction.
+        """
+        chunks = max(1, min(self.config['workers'], len(frame) // self.MIN_ROWS_PER_WORKER))
+        if chunks == 1:
+            return await self.load_table(self.conn, table, frame, id_column, key_type)
+        
+        # One pool for the whole run, so worker startup is paid once rather than per chunk.
+        # Spawned, not forked: the Arrow reader and Polars already have threads running
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.config['workers'], mp_context=multiprocessing.get_context('spawn')
+            )
+        
+        # Names are never reused within a run: the main connection holds a lock on
+        # each stage it has moved until the import commits
+        size = math.ceil(len(frame) / chunks)
+        starts = range(0, len(frame), size)
+        stages = [f"{table}_stage_{len(self.worker_stages) + n}" for n in range(len(starts))]
+        self.worker_stages.extend(stages)
+        
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self.pool, load_chunk, self.config, table, stage,
+                                 frame.iloc[start:start + size], id_column, key_type)
+            for stage, start in zip(stages, starts)
+        ))
+        
+        # Ids were drawn while staging, so they are carried over rather than regenerated
+        if id_column:
+            columns = ', '.join([id_column, *frame.columns[1:]])
+            move = f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {{stage}}"
+        else:
+            move = f"INSERT INTO {table} SELECT * FROM {{stage}}"
+        await self.execute_batch(self.conn, [
+            statement for stage in stages
+            for statement in (move.format(stage=stage), f"DROP TABLE {stage}")
+        ])
+        
+        mapping = {}
+        for result in results:
+            mapping.update(result)
+        return mapping
+    
+    @staticmethod
+    def to_int(values: pd.Series) -> pd.Series:
+        """Convert to nullable Int64; unparseable values or ones beyond 64 bits become NA, fractions truncate."""
+        numbers = pd.to_numeric(values, errors='coerce').astype('float64')
+        return np.trunc(numbers.where(numbers.abs() < 2**63)).astype('Int64')
+    
+    @staticmethod
+    def out_of_range(values: pd.Series, limit: float) -> pd.Series:
+        """True where values exceed limit in magnitude; missing values are in range."""
+        return (values.abs() > limit).fillna(False)
+    
+    async def import_customers(self, known: Dict[int, int]) -> Dict[int, int]:
+        """
+        Import customer records from the current chunk, skipping ids already in known.
+        Returns mapping of new source Customer IDs to database customer_id.
+        """
+        # Source column -> customers table column
+        customer_cols = {
+            'Customer Email': 'customer_email',
+            'Customer Fname': 'customer_fname',
+            'Customer Lname': 'customer_lname',
+            'Customer Segment': 'customer_segment',
+            'Customer City': 'customer_city',
+            'Customer State': 'customer_state',
+            'Customer Country': 'customer_country',
+            'Customer Zipcode': 'customer_zipcode',
+            'Customer Street': 'customer_street',
+            'Latitude': 'latitude',
+            'Longitude': 'longitude'
+        }
         
-        customer_map = {}
-        imported = 0
-        
-        for _, row in customers_unique.iterrows():
-            try:
-                source_id = int(row['Customer Id'])
-                email = str(row.get('Customer Email', f'customer_{source_id}@placeholder.com'))
-                
-                cursor.execute(insert_query, (
-                    email,
-                    str(row.get('Customer Fname', '')),
-                    str(row.get('Customer Lname', '')),
-                    str(row.get('Customer Segment', '')) if pd.notna(row.get('Customer Segment')) else None,
-                    str(row.get('Customer City', '')) if pd.notna(row.get('Customer City')) else None,
-                    str(row.get('Customer State', '')) if pd.notna(row.get('Customer State')) else None,
-                    str(row.get('Customer Country', '')) if pd.notna(row.get('Customer Country')) else None,
-                    str(row.get('Customer Zipcode', '')) if pd.notna(row.get('Customer Zipcode')) else None,
-                    str(row.get('Customer Street', '')) if pd.notna(row.get('Customer Street')) else None,
-                    self.clean_numeric(row.get('Latitude')),
-                    self.clean_numeric(row.get('Longitude'))
-                ))
-                
-                result = cursor.fetchone()
-                if result:
-                    customer_map[source_id] = result[0]
-                    imported += 1
-                    
-                if imported % 1000 == 0:
-                    self.conn.commit()
-                    print(f"  Progress: {imported:,}", end='\r')
-                    
-            except Exception:
-                continue
-        
-        self.conn.commit()
-        print(f"\n✓ Imported {imported:,}")
+        # Deduplicate by Customer ID
+        customers = (
+            pl.from_pandas(self.df.reindex(columns=['Customer Id', *customer_cols])).lazy()
+            .with_columns(
+                pl.col('Customer Id').cast(pl.Float64, strict=False).cast(pl.Int64, strict=False),
+                pl.col('Latitude', 'Longitude').cast(pl.Float64, strict=False)
+            )
+            .filter(pl.col('Customer Id').is_not_null() & ~pl.col('Customer Id').is_in(list(known)))
+            .unique(subset=['Customer Id'], keep='first', maintain_order=True)
+            .with_columns(
+                pl.col('Customer Email').fill_null(
+                    pl.format('customer_{}@placeholder.com', pl.col('Customer Id'))
+                ),
+                pl.col('Customer Fname', 'Customer Lname').fill_null(''),
+                # Coordinates a REAL column cannot hold are dropped rather than the customer
+                *(pl.when(pl.col(c).abs() <= self.REAL_MAX).then(pl.col(c)).alias(c)
+                  for c in ('Latitude', 'Longitude'))
+            )
+            .rename(customer_cols)
+            .collect()
+        )
+        
+        customer_map = await self.load_parallel(
+            'customers', customers.to_pandas(use_pyarrow_extension_array=True), 'customer_id'
+        )
+        
+        self.stats['customers'] += len(customer_map)
         return customer_map
     
-    def import_products(self) -> Dict[str, int]:
+    async def import_products(self, known: Dict[str, int]) -> Dict[str, int]:
         """
-        Import product catalog with deduplication.
-        Returns mapping of product name to database product_id.
+        Import products from the current chunk, skipping names already loaded or rejected.
+        Returns mapping of new product names to database product_id.
         """
-        print("\n[3/5] Importing Products...")
-        
-        cursor = self.conn.cursor()
-        
         product_cols = [
             'Product Name', 'Product Card Id', 'Category Name', 'Department Name',
             'Product Price', 'Product Description', 'Product Image', 'Product Status'
         ]
         
-        products = self.df[[col for col in product_cols if col in self.df.columns]].copy()
-        products['Product Name'] = products['Product Name'].astype(str).str.strip()
-        products = products[
-            (products['Product Name'].notna()) &
-            (products['Product Name'] != 'nan') &
-            (products['Product Name'] != '')
-        ]
-        
-        products_unique = products.groupby('Product Name', as_index=False).first()
-        print(f"  Unique products: {len(products_unique):,}")
-        
-        insert_query = """
-            INSERT INTO products (
-                product_name, product_card_id, category_name, department_name,
-                product_price, product_description, product_image, product_status
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING product_id, product_name
-        """
-        
-        product_map = {}
-        imported = 0
-        
-        for _, row in products_unique.iterrows():
-            try:
-                product_name = str(row['Product Name']).strip()
-                
-                cursor.execute(insert_query, (
-                    product_name,
-                    self.clean_int(row.get('Product Card Id')),
-                    str(row.get('Category Name', '')) if pd.notna(row.get('Category Name')) else None,
-                    str(row.get('Department Name', '')) if pd.notna(row.get('Department Name')) else None,
-                    self.clean_numeric(row.get('Product Price')),
-                    str(row.get('Product Description', '')) if pd.notna(row.get('Product Description')) else None,
-                    str(row.get('Product Image', '')) if pd.notna(row.get('Product Image')) else None,
-                    self.clean_int(row.get('Product Status'))
-                ))
-                
-                result = cursor.fetchone()
-                if result:
-                    product_map[product_name] = result[0]
-                    imported += 1
-                    
-            except Exception:
-                continue
-        
-        self.conn.commit()
-        print(f"✓ Imported {imported:,}")
+        catalog = (
+            pl.from_pandas(self.df.reindex(columns=product_cols)).lazy()
+            .with_columns(pl.col('Product Name').str.strip_chars())
+            .filter(
+                pl.col('Product Name').is_not_null() & (pl.col('Product Name') != '') &
+                ~pl.col('Product Name').is_in([*known, *self.rejected_products])
+            )
+            .unique(subset=['Product Name'], keep='first', maintain_order=True)
+            .select(
+                pl.col('Product Name').alias('source_key'),
+                pl.col('Product Name').alias('product_name'),
+                pl.col('Product Card Id').cast(pl.Float64, strict=False).cast(pl.Int64, strict=False).alias('product_card_id'),
+                pl.col('Category Name').alias('category_name'),
+                pl.col('Department Name').alias('department_name'),
+                pl.col('Product Price').cast(pl.Float64, strict=False).alias('product_price'),
+                pl.col('Product Description').cast(pl.Utf8).alias('product_description'),
+                pl.col('Product Image').alias('product_image'),
+                pl.col('Product Status').cast(pl.Float64, strict=False).cast(pl.Int64, strict=False).alias('product_status')
+            )
+            .collect()
+        )
+        
+        valid = (
+            (pl.col('product_price').is_null() | pl.col('product_price').is_between(0, self.REAL_MAX)) &
+            (pl.col('product_card_id').is_null() | (pl.col('product_card_id').abs() <= self.INTEGER_MAX)) &
+            (pl.col('product_status').is_null() | pl.col('product_status').is_in([0, 1]))
+        )
+        
+        product_map = await self.load_parallel(
+            'products', catalog.filter(valid).to_pandas(use_pyarrow_extension_array=True),
+            'product_id', 'TEXT'
+        )
+        
+        self.stats['products'] += len(product_map)
+        self.rejected_products.update(catalog.filter(~valid)['product_name'].to_list())
         return product_map
     
-    def import_orders(self, customer_map: Dict[int, int], product_map: Dict[str, int]) -> Dict[int, int]:
+    async def import_orders(self, customer_map: Dict[int, int], product_map: Dict[str, int]) -> Dict[int, int]:
         """
         Import order transactions with foreign key resolution.
         Returns mapping of DataFrame index to database order_id.
         """
-        print("\n[4/5] Importing Orders...")
-        
-        cursor = self.conn.cursor()
-        
-        insert_query = """
-            INSERT INTO orders (
-                order_item_id, customer_id, product_id, order_date, order_date_dateorders,
-                order_quantity, sales, discount, profit_per_order, order_status,
-                market, order_region, order_country, order_city, order_state, order_zipcode
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING order_id
-        """
-        
-        order_map = {}
-        processed = 0
-        skipped = {'no_customer': 0, 'no_product': 0, 'error': 0}
-        
-        for idx, row in self.df.iterrows():
-            source_customer_id = int(row['Customer Id']) if pd.notna(row.get('Customer Id')) else None
-            product_name = str(row.get('Product Name', '')).strip() if pd.notna(row.get('Product Name')) else None
-            
-            customer_id = customer_map.get(source_customer_id)
-            product_id = product_map.get(product_name)
-            
-            if not customer_id:
-                skipped['no_customer'] += 1
-                continue
-            if not product_id:
-                skipped['no_product'] += 1
-                continue
-            
-            try:
-                cursor.execute(insert_query, (
-                    self.clean_int(row.get('Order Item Id')),
-                    customer_id,
-                    product_id,
-                    str(row.get('order date (DateOrders)', '')) if pd.notna(row.get('order date (DateOrders)')) else None,
-                    str(row.get('order date (DateOrders)', '')) if pd.notna(row.get('order date (DateOrders)')) else None,
-                    self.clean_int(row.get('Order Item Quantity')),
-                    self.clean_numeric(row.get('Sales per customer')),
-                    self.clean_numeric(row.get('Order Item Discount')),
-                    self.clean_numeric(row.get('Order Profit Per Order')),
-                    str(row.get('Order Status', '')) if pd.notna(row.get('Order Status')) else None,
-                    str(row.get('Market', '')) if pd.notna(row.get('Market')) else None,
-                    str(row.get('Order Region', '')) if pd.notna(row.get('Order Region')) else None,
-                    str(row.get('Order Country', '')) if pd.notna(row.get('Order Country')) else None,
-                    str(row.get('Order City', '')) if pd.notna(row.get('Order City')) else None,
-                    str(row.get('Order State', '')) if pd.notna(row.get('Order State')) else None,
-                    str(row.get('Order Zipcode', '')) if pd.notna(row.get('Order Zipcode')) else None
-                ))
-                
-                result = cursor.fetchone()
-                if result:
-                    order_map[idx] = result[0]
-                    processed += 1
-                    
-                if processed % self.config['batch_size'] == 0:
-                    self.conn.commit()
-                    print(f"  Progress: {processed:,}", end='\r')
-                    
-            except psycopg2.Error:
-                skipped['error'] += 1
-                continue
-        
-        self.conn.commit()
-        print(f"\n✓ Imported {processed:,}")
-        
-        total = sum(skipped.values())
-        if total > 0:
-            print(f"  Skipped {total:,}: {skipped['no_customer']:,} missing customer, "
-                  f"{skipped['no_product']:,} missing product, {skipped['error']:,} errors")
-        
+        # Foreign keys resolved with hash lookups over whole columns
+        customer_fk = self.to_int(self.df['Customer Id']).map(customer_map).astype('Int64')
+        product_fk = self.df['Product Name'].str.strip().map(product_map).astype('Int64')
+        no_customer = customer_fk.isna()
+        no_product = product_fk.isna() & ~no_customer
+        
+        # Parsed once here; the raw source text is kept in order_date_dateorders
+        order_date = pd.to_datetime(
+            self.df['order date (DateOrders)'], format='%m/%d/%Y %H:%M', errors='coerce'
+        )
+        orders = pd.DataFrame({
+            'source_key': self.df.index,
+            'order_item_id': self.to_int(self.df['Order Item Id']),
+            'customer_id': customer_fk,
+            'product_id': product_fk,
+            'order_date': order_date,
+            'order_date_dateorders': self.df['order date (DateOrders)'],
+            'order_quantity': self.to_int(self.df['Order Item Quantity']),
+            'sales': pd.to_numeric(self.df['Sales per customer'], errors='coerce').astype('float64'),
+            'discount': pd.to_numeric(self.df['Order Item Discount'], errors='coerce').astype('float64'),
+            'profit_per_order': pd.to_numeric(self.df['Order Profit Per Order'], errors='coerce').astype('float64'),
+            'order_status': self.df['Order Status'],
+            'market': self.df['Market'],
+            'order_region': self.df['Order Region'],
+            'order_country': self.df['Order Country'],
+            'order_city': self.df['Order City'],
+            'order_state': self.df['Order State'],
+            'order_zipcode': self.df['Order Zipcode']
+        }, index=self.df.index)
+        
+        # Rows the schema would reject, by constraint or column range, are filtered
+        # up front, since COPY is all-or-nothing
+        invalid = (
+            orders['order_item_id'].isna() | orders['order_date'].isna() |
+            (orders['order_quantity'] <= 0).fillna(False) | (orders['sales'] < 0) |
+            self.out_of_range(orders['order_item_id'], self.INTEGER_MAX) |
+            self.out_of_range(orders['order_quantity'], self.INTEGER_MAX) |
+            self.out_of_range(orders['sales'], self.REAL_MAX) |
+            self.out_of_range(orders['discount'], self.REAL_MAX) |
+            self.out_of_range(orders['profit_per_order'], self.REAL_MAX)
+        ) & ~no_customer & ~no_product
+        
+        order_map = await self.load_parallel(
+            'orders', orders[~(no_customer | no_product | invalid)], 'order_id'
+        )
+        
+        self.stats['orders'] += len(order_map)
+        self.stats['no_customer'] += int(no_customer.sum())
+        self.stats['no_product'] += int(no_product.sum())
+        self.stats['invalid_orders'] += int(invalid.sum())
         return order_map
     
-    def import_shipping(self, order_map: Dict[int, int]) -> None:
-        """Import shipping records linked to orders."""
-        print("\n[5/5] Importing Shipping...")
-        
-        cursor = self.conn.cursor()
+    async def import_shipping(self, order_map: Dict[int, int]) -> None:
+        """Import shipping records linked to orders from the current chunk."""
+        shipping = pd.DataFrame({
+            'order_id': self.df.index.map(order_map).astype('Int64'),
+            'shipping_date': self.df['shipping date (DateOrders)'],
+            'shipping_mode': self.df['Shipping Mode'],
+            'days_for_shipping_real': self.to_int(self.df['Days for shipping (real)']),
+            'days_for_shipment_scheduled': self.to_int(self.df['Days for shipment (scheduled)']),
+            'delivery_status': self.df['Delivery Status'],
+            'late_delivery_risk': self.to_int(self.df['Late_delivery_risk'])
+        }, index=self.df.index)
+        
+        invalid = (
+            shipping['order_id'].isna() |
+            (shipping['days_for_shipping_real'] < 0).fillna(False) |
+            (shipping['days_for_shipment_scheduled'] < 0).fillna(False) |
+            self.out_of_range(shipping['days_for_shipping_real'], self.INTEGER_MAX) |
+            self.out_of_range(shipping['days_for_shipment_scheduled'], self.INTEGER_MAX) |
+            (shipping['late_delivery_risk'].notna() & ~shipping['late_delivery_risk'].isin([0, 1]))
+        )
+        
+        await self.load_parallel('shipping_details', shipping[~invalid])
+        
+        self.stats['shipping'] += int((~invalid).sum())
+        self.stats['invalid_shipping'] += int(invalid.sum())
+    
+    async def import_chunks(self) -> None:
+        """Stream the CSV through all four tables one chunk at a time."""
+        print("\n[2/3] Importing...")
+        
+        customer_map: Dict[int, int] = {}
+        product_map: Dict[str, int] = {}
+        last_progress = time.monotonic()
+        
+        for chunk in self.read_chunks():
+            self.df = chunk
+            customer_map.update(await self.import_customers(customer_map))
+            product_map.update(await self.import_products(product_map))
+            order_map = await self.import_orders(customer_map, product_map)
+            await self.import_shipping(order_map)
+            
+            self.stats['rows'] += len(chunk)
+            if time.monotonic() - last_progress >= self.PROGRESS_INTERVAL:
+                logger.info("Progress: %d rows", self.stats['rows'])
+                last_progress = time.monotonic()
+        
+        stats = self.stats
+        print(f"✓ Customers {stats['customers']:>12,}")
+        print(f"✓ Products  {stats['products']:>12,}")
+        if self.rejected_products:
+            print(f"  Skipped {len(self.rejected_products):,} (invalid values)")
+        
+        print(f"✓ Orders    {stats['orders']:>12,}")
+        skipped = stats['no_customer'] + stats['no_product'] + stats['invalid_orders']
+        if skipped > 0:
+            print(f"  Skipped {skipped:,}: {stats['no_customer']:,} missing customer, "
+                  f"{stats['no_product']:,} missing product, {stats['invalid_orders']:,} invalid")
         
-        insert_query = """
-            INSERT INTO shipping_details (
-                order_id, shipping_date, shipping_mode, days_for_shipping_real,
-                days_for_shipment_scheduled, delivery_status, late_delivery_risk
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+        print(f"✓ Shipping  {stats['shipping']:>12,}")
+        if stats['invalid_shipping'] > 0:
+            print(f"  Skipped {stats['invalid_shipping']:,} (no matching order or invalid values)")
+    
+    async def drop_constraints(self) -> None:
         """
+        Drop foreign keys and secondary indexes before bulk load.
+        Definitions are read from the catalog and kept for restore_constraints.
+        """
+        tables = ['customers', 'products', 'orders', 'shipping_details']
+        
+        statements = await self.conn.fetch("""
+            SELECT format('ALTER TABLE %s DROP CONSTRAINT %I', conrelid::regclass, conname),
+                   format('ALTER TABLE %s ADD CONSTRAINT %I %s',
+                          conrelid::regclass, conname, pg_get_constraintdef(oid))
+            FROM pg_constraint
+            WHERE contype = 'f' AND conrelid = ANY($1::text[]::regclass[])
+            UNION ALL
+            SELECT format('DROP INDEX %s', indexrelid::regclass), pg_get_indexdef(indexrelid)
+            FROM pg_index
+            WHERE NOT indisprimary AND NOT indisunique AND indrelid = ANY($1::text[]::regclass[])
+        """, tables)
+        
+        await self.execute_batch(self.conn, [drop for drop, _ in statements])
+        
+        # Recorded before committing, so an interrupted commit still leads to a rebuild
+        # (or at least the DDL being printed) in run()
+        self.restore_ddl = [create for _, create in reversed(statements)]
+        
+        # Committed so worker connections are not blocked by the DDL locks
+        await self.commit()
+        print(f"✓ Dropped {len(statements)} foreign keys and indexes for bulk load")
+    
+    async def restore_constraints(self) -> None:
+        """
+        Recreate the indexes and foreign keys removed by drop_constraints.
+        Commits the import transaction, so all loaded rows and validation succeed or fail together.
+        """
+        await self.execute_batch(self.conn, self.restore_ddl)
         
-        processed = 0
-        skipped = 0
-        
-        for idx, row in self.df.iterrows():
-            order_id = order_map.get(idx)
-            if not order_id:
-                skipped += 1
-                continue
-            
-            try:
-                cursor.execute(insert_query, (
-                    order_id,
-                    str(row.get('shipping date (DateOrders)', '')) if pd.notna(row.get('shipping date (DateOrders)')) else None,
-                    str(row.get('Shipping Mode', '')) if pd.notna(row.get('Shipping Mode')) else None,
-                    self.clean_int(row.get('Days for shipping (real)')),
-                    self.clean_int(row.get('Days for shipment (scheduled)')),
-                    str(row.get('Delivery Status', '')) if pd.notna(row.get('Delivery Status')) else None,
-                    self.clean_int(row.get('Late_delivery_risk'))
-                ))
-                
-                processed += 1
-                
-                if processed % self.config['batch_size'] == 0:
-                    self.conn.commit()
-                    print(f"  Progress: {processed:,}", end='\r')
-                    
-            except psycopg2.Error:
-                skipped += 1
-                continue
+        await self.commit()
+        print(f"\n[3/3] Rebuilt {len(self.restore_ddl)} foreign keys and indexes")
+        self.restore_ddl = []
+    
+    async def recover_constraints(self) -> None:
+        """
+        Roll back a failed import, drop leftover worker stages and rebuild the dropped constraints.
+        If the rebuild fails too, the DDL is printed so it can be run by hand.
+        """
+        try:
+            await self.rollback()
+        except Exception as e:
+            # Connection is unusable (e.g. dropped mid-load); its locks go with it
+            print(f"✗ Rollback failed: {e}")
+            self.conn.terminate()
+            self.conn = None
         
-        self.conn.commit()
-        print(f"\n✓ Imported {processed:,}")
-        if skipped > 0:
-            print(f"  Skipped {skipped:,} (no matching order)")
+        try:
+            if self.conn is None:
+                self.conn = await self.open_connection(self.config['db_config'])
+                await self.begin()
+            if self.worker_stages:
+                # Chunks committed by workers but never moved into the real tables
+                await self.conn.execute(f"DROP TABLE IF EXISTS {', '.join(self.worker_stages)}")
+            await self.restore_constraints()
+        except Exception as e:
+            print(f"✗ Could not rebuild foreign keys and indexes: {e}")
+            print("  Run these statements to restore them:")
+            for create in self.restore_ddl:
+                print(f"    {create};")
     
-    def verify_import(self) -> None:
+    async def verify_import(self) -> None:
         """Display import summary and key metrics."""
         print("\n" + "="*60)
         print("Import Summary")
         print("="*60)
         
-        cursor = self.conn.cursor()
-        
         print("\nTable Counts:")
         for table in ['customers', 'products', 'orders', 'shipping_details']:
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            count = cursor.fetchone()[0]
+            count = await self.conn.fetchval(f"SELECT COUNT(*) FROM {table}")
             print(f"  {table:20s} {count:>12,}")
         
         print("\nBusiness Metrics:")
-        cursor.execute("""
+        metrics = await self.conn.fetchrow("""
             SELECT 
                 COUNT(DISTINCT order_id),
                 ROUND(SUM(sales)::numeric, 2),
@@ -365,7 +668,6 @@ class SupplyChainImporter:
             FROM orders
         """)
         
-        metrics = cursor.fetchone()
         if metrics and metrics[0]:
             print(f"  Orders               {metrics[0]:>12,}")
             print(f"  Revenue           ${metrics[1]:>13,}")
@@ -373,7 +675,7 @@ class SupplyChainImporter:
             print(f"  Units                {metrics[3]:>12,}")
         
         print("\nDelivery Performance:")
-        cursor.execute("""
+        delivery = await self.conn.fetchrow("""
             SELECT 
                 SUM(CASE WHEN late_delivery_risk = 1 THEN 1 ELSE 0 END),
                 SUM(CASE WHEN late_delivery_risk = 0 THEN 1 ELSE 0 END),
@@ -381,7 +683,6 @@ class SupplyChainImporter:
             FROM shipping_details
         """)
         
-        delivery = cursor.fetchone()
         if delivery and delivery[0] is not None:
             print(f"  Late                 {delivery[0]:>12,}")
             print(f"  On-Time              {delivery[1]:>12,}")
@@ -389,7 +690,7 @@ class SupplyChainImporter:
         
         print("="*60)
     
-    def run(self) -> None:
+    async def run(self) -> None:
         """Execute full ETL pipeline."""
         start = datetime.now()
         
@@ -397,15 +698,14 @@ class SupplyChainImporter:
         print("="*60)
         
         try:
-            self.connect_database()
+            await self.connect_database()
             self.load_csv()
+            await self.drop_constraints()
             
-            customer_map = self.import_customers()
-            product_map = self.import_products()
-            order_map = self.import_orders(customer_map, product_map)
-            self.import_shipping(order_map)
+            await self.import_chunks()
+            await self.restore_constraints()
             
-            self.verify_import()
+            await self.verify_import()
             
             elapsed = (datetime.now() - start).total_seconds()
             print(f"\n✓ Completed in {elapsed:.1f}s")
@@ -419,17 +719,47 @@ class SupplyChainImporter:
             print(f"\n✗ Failed: {e}")
             import traceback
             traceback.print_exc()
-            if self.conn:
-                self.conn.rollback()
         finally:
+            # Workers are stopped first so none can commit a stage after cleanup
+            if self.pool:
+                self.pool.shutdown(cancel_futures=True)
+            # Also reached on Ctrl-C, which is not an Exception
+            if self.restore_ddl:
+                await self.recover_constraints()
             if self.conn:
-                self.conn.close()
+                await self.conn.close()
+
+
+def load_chunk(config: dict, table: str, stage: str, frame: pd.DataFrame, id_column: Optional[str],
+               key_type: str) -> dict:
+    """
+    Worker process entry point: stage one chunk on a dedicated connection.
+    Returns mapping of source key to generated id when id_column is given.
+    """
+    async def load() -> dict:
+        importer = SupplyChainImporter(config)
+        conn = await importer.open_connection(
+            config['db_config'], lock_timeout=importer.WORKER_LOCK_TIMEOUT
+        )
+        try:
+            async with conn.transaction():
+                await importer.stage_frame(conn, 'UNLOGGED', stage, table, frame,
+                                           key_type if id_column else None)
+                if not id_column:
+                    return {}
+                rows = await conn.fetch(f"SELECT source_key, {id_column} FROM {stage}")
+                return dict(map(tuple, rows))
+        finally:
+            await conn.close()
+    
+    return asyncio.run(load())
 
 
 def main():
     """Entry point."""
+    logging.basicConfig(level=logging.INFO, format='  %(message)s')
     importer = SupplyChainImporter(CONFIG)
-    importer.run()
+    asyncio.run(importer.run())
 
 
 if __name__ == "__main__":
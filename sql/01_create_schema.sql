@@ -58,7 +58,7 @@ CREATE TABLE orders (
     order_item_id INTEGER NOT NULL,
     customer_id INTEGER NOT NULL,
     product_id INTEGER NOT NULL,
-    order_date TEXT NOT NULL,
+    order_date TIMESTAMP NOT NULL,
     order_date_dateorders TEXT,
     order_quantity INTEGER,
     sales REAL,
@@ -10,7 +10,7 @@ DROP VIEW IF EXISTS v_executive_kpis CASCADE;
 
 CREATE VIEW v_executive_kpis AS
 SELECT 
-    TO_CHAR(TO_DATE(o.order_date, 'MM/DD/YYYY'), 'YYYY-MM') as year_month,
+    TO_CHAR(o.order_date, 'YYYY-MM') as year_month,
     COUNT(DISTINCT o.order_id) as total_orders,
     COUNT(DISTINCT o.customer_id) as unique_customers,
     SUM(o.order_quantity) as total_units_sold,
@@ -22,7 +22,7 @@ SELECT
     ROUND((SUM(CASE WHEN sd.late_delivery_risk = 0 THEN 1 ELSE 0 END) * 100.0 / COUNT(*))::numeric, 2) as on_time_pct
 FROM orders o
 LEFT JOIN shipping_details sd ON o.order_id = sd.order_id
-WHERE o.order_date IS NOT NULL AND o.order_date != ''
+WHERE o.order_date IS NOT NULL
 GROUP BY year_month
 ORDER BY year_month;
 
@@ -113,7 +113,7 @@ DROP VIEW IF EXISTS v_category_performance CASCADE;
 
 CREATE VIEW v_category_performance AS
 SELECT 
-    TO_CHAR(TO_DATE(o.order_date, 'MM/DD/YYYY'), 'YYYY-MM') as year_month,
+    TO_CHAR(o.order_date, 'YYYY-MM') as year_month,
     p.department_name,
     p.category_name,
     COUNT(DISTINCT o.order_id) as total_orders,
@@ -123,7 +123,7 @@ SELECT
     ROUND((SUM(o.profit_per_order) * 100.0 / NULLIF(SUM(o.sales), 0))::numeric, 2) as profit_margin_pct
 FROM orders o
 JOIN products p ON o.product_id = p.product_id
-WHERE o.order_date IS NOT NULL AND o.order_date != ''
+WHERE o.order_date IS NOT NULL
 GROUP BY year_month, p.department_name, p.category_name
 ORDER BY year_month;
 
@@ -134,7 +134,7 @@ CREATE VIEW v_order_details AS
 SELECT 
     o.order_id,
     o.order_date,
-    TO_CHAR(TO_DATE(o.order_date, 'MM/DD/YYYY'), 'YYYY-MM') as year_month,
+    TO_CHAR(o.order_date, 'YYYY-MM') as year_month,
     c.customer_id,
     c.customer_fname || ' ' || c.customer_lname as customer_name,
     c.customer_segment,